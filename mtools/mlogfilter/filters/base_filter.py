@@ -9,9 +9,14 @@ class BaseFilter(object):
     first tuple element is the filter argument, e.g. --xyz. The second
     element of the tuple is a dictionary that gets passed to the
     ArgumentParser object's add_argument method.
+
+    priority determines the order in which active filters are asked to
+    accept a logevent, lowest first. Evaluation stops at the first filter
+    that rejects, so cheap and selective filters should use a low value.
     """
 
     filterArgs = []
+    priority = 2
 
     def __init__(self, mlogfilter):
         """
@@ -75,6 +75,10 @@ class DateTimeFilter(BaseFilter):
                   'default': 'end', 'help': 'output up to TO', 'dest': 'to'})
         ]
 
+    # always ask first: skips large ranges and tracks whether --from and
+    # --to have been reached, which requires seeing every line
+    priority = 0
+
     timeunits = ['s', 'sec', 'm', 'min', 'h', 'hours', 'd', 'days', 'w',
                  'weeks', 'mo', 'months', 'y', 'years']
     weekdays = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
@@ -132,6 +136,15 @@ class DateTimeFilter(BaseFilter):
                                                      self.mlogfilter
                                                      .args['to'] or None)
 
+        # express the bounds in the timezone of the log lines: comparing
+        # datetimes that share a tzinfo object is a plain field compare,
+        # otherwise each comparison calls utcoffset() on both sides
+        if not self.mlogfilter.is_stdin:
+            tz = self.mlogfilter.args['logfile'][0].timezone
+            if tz is not None:
+                self.fromDateTime = self.fromDateTime.astimezone(tz)
+                self.toDateTime = self.toDateTime.astimezone(tz)
+
         # define start_limit for mlogfilter's fast_forward method
         self.start_limit = self.fromDateTime
 
@@ -145,6 +158,8 @@ class DateTimeFilter(BaseFilter):
                 logfile.fast_forward(self.toDateTime)
                 self.seek_to = logfile.filehandle.tell()
                 logfile.filehandle.seek(0)
+                # accept() checks the position on every line
+                self.filehandle = logfile.filehandle
             else:
                 self.seek_to = -1
         else:
@@ -159,8 +174,7 @@ class DateTimeFilter(BaseFilter):
         """
         if self.fromReached and self.seek_to:
             if self.seek_to != -1:
-                self.toReached = (self.mlogfilter.args['logfile'][0]
-                                  .filehandle.tell() >= self.seek_to)
+                self.toReached = self.filehandle.tell() >= self.seek_to
             return True
         else:
             # slow version has to check each datetime
@@ -170,12 +184,13 @@ class DateTimeFilter(BaseFilter):
             if dt is None:
                 return self.fromReached
 
-            if self.fromDateTime <= dt <= self.toDateTime:
+            toDateTime = self.toDateTime
+            if self.fromDateTime <= dt <= toDateTime:
                 self.toReached = False
                 self.fromReached = True
                 return True
 
-            elif dt > self.toDateTime:
+            elif dt > toDateTime:
                 self.toReached = True
                 return False
 
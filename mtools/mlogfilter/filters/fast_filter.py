@@ -16,6 +16,9 @@ class FastFilter(BaseFilter):
                              'than FAST ms (default 1000)')})
         ]
 
+    # duration is cheap to extract
+    priority = 1
+
     def __init__(self, mlogfilter):
         BaseFilter.__init__(self, mlogfilter)
         if ('fast' in self.mlogfilter.args and
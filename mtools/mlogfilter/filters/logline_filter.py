@@ -71,6 +71,9 @@ class LogLineFilter(BaseFilter):
             })
         ]
 
+    # may need to parse operation, namespace and query pattern
+    priority = 3
+
     def __init__(self, mlogfilter):
         BaseFilter.__init__(self, mlogfilter)
 
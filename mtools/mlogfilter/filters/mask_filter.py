@@ -42,6 +42,9 @@ class MaskFilter(DateTimeFilter):
                                     'are returned.')})
         ]
 
+    # scans the mask list for every line
+    priority = 3
+
     def __init__(self, mlogfilter):
         """
         Constructor.
@@ -16,6 +16,9 @@ class SlowFilter(BaseFilter):
                                           '(default 1000)')})
         ]
 
+    # duration is cheap to extract
+    priority = 1
+
     def __init__(self, mlogfilter):
         BaseFilter.__init__(self, mlogfilter)
 
@@ -17,6 +17,8 @@ class WordFilter(BaseFilter):
         # extract all arguments passed into 'word'
         if 'word' in self.mlogfilter.args and self.mlogfilter.args['word']:
             self.words = self.mlogfilter.args['word'].split()
+            # words are regular expressions; compile each one only once
+            self.wordRegexes = [re.compile(word) for word in self.words]
             self.active = True
         else:
             self.active = False
@@ -28,7 +30,5 @@ class WordFilter(BaseFilter):
         Overwrite BaseFilter.accept() and return True if the provided
         logevent should be accepted (causing output), or False if not.
         """
-        for word in self.words:
-            if re.search(word, logevent.line_str):
-                return True
-        return False
+        line_str = logevent.line_str
+        return any(regex.search(line_str) for regex in self.wordRegexes)
@@ -8,17 +8,25 @@ from datetime import MAXYEAR, MINYEAR, datetime, timedelta
 from dateutil.tz import tzutc
 
 import mtools.mlogfilter.filters as filters
+from mtools.mlogfilter.filters.base_filter import BaseFilter
 from mtools.util.cmdlinetool import LogFileTool
 
+# all filter classes from the filters module, collected once at import
+FILTER_CLASSES = [c[1] for c in inspect.getmembers(filters, inspect.isclass)]
+
 
 class MLogFilterTool(LogFileTool):
 
+    # sort keys used when merging log files, built once rather than per line
+    mergeKeyMax = datetime(MAXYEAR, 12, 31, 23, 59, 59, 999999, tzutc())
+    mergeKeyMin = datetime(MINYEAR, 1, 1, 0, 0, 0, 0, tzutc())
+
     def __init__(self):
         LogFileTool.__init__(self, multiple_logfiles=True, stdin_allowed=True)
 
-        # add all filter classes from the filters module
-        self.filters = [c[1] for c in inspect.getmembers(filters,
-                                                         inspect.isclass)]
+        # add all filter classes from the filters module (copy, addFilter
+        # may extend the list)
+        self.filters = list(FILTER_CLASSES)
 
         self.argparser.description = ('mongod/mongos log file parser. Use '
                                       'parameters to enable filters. A line '
@@ -96,8 +104,10 @@ class MLogFilterTool(LogFileTool):
             logevent._reformat_timestamp(self.args['timestamp_format'],
                                          force=True)
 
+        # write directly instead of print(), which issues separate writes
+        # for the line and the line break; stdout buffers the output
         if self.args['json']:
-            print(logevent.to_json())
+            sys.stdout.write(logevent.to_json() + '\n')
             return
         line = logevent.line_str
 
@@ -109,7 +119,7 @@ class MLogFilterTool(LogFileTool):
             line = self._changeMs(line)
             line = self._formatNumbers(line)
 
-        print(line)
+        sys.stdout.write(line + '\n')
 
     def _msToString(self, ms):
         """Change milliseconds to hours min sec ms format."""
@@ -176,12 +186,11 @@ class MLogFilterTool(LogFileTool):
         if not logevent:
             # if logfile end is reached, return max datetime to never
             # pick this line
-            return datetime(MAXYEAR, 12, 31, 23, 59, 59, 999999, tzutc())
+            return self.mergeKeyMax
 
         # if no datetime present (line doesn't have one) return mindate
         # to pick this line immediately
-        return logevent.datetime or datetime(MINYEAR, 1, 1, 0, 0, 0, 0,
-                                             tzutc())
+        return logevent.datetime or self.mergeKeyMin
 
     def _merge_logfiles(self):
         """Helper method to merge several files together by datetime."""
@@ -287,8 +296,10 @@ class MLogFilterTool(LogFileTool):
         # create filter objects from classes and pass args
         self.filters = [f(self) for f in self.filters]
 
-        # remove non-active filter objects
+        # remove non-active filter objects and order the remaining ones
+        # so that cheap, selective filters are asked first
         self.filters = [f for f in self.filters if f.active]
+        self.filters.sort(key=lambda f: f.priority)
 
         # call setup for each active filter
         for f in self.filters:
@@ -336,26 +347,36 @@ class MLogFilterTool(LogFileTool):
         if 'logfile' not in self.args or not self.args['logfile']:
             raise SystemExit('no logfile found.')
 
+        # the set of filters is fixed from here on: bind their methods once,
+        # and only ask filters that can actually skip remaining lines
+        accepts = [f.accept for f in self.filters]
+        skips = [f.skipRemaining for f in self.filters
+                 if type(f).skipRemaining is not BaseFilter.skipRemaining]
+        exclude = self.args['exclude']
+
         for logevent in self.logfile_generator():
-            if self.args['exclude']:
+            if exclude:
                 # print line if any filter disagrees
-                if any([not f.accept(logevent) for f in self.filters]):
+                if not all(accept(logevent) for accept in accepts):
                     self._outputLine(logevent, self.args['shorten'],
                                      self.args['human'])
 
             else:
-                # only print line if all filters agree
-                if all([f.accept(logevent) for f in self.filters]):
+                # only print line if all filters agree (stops at the first
+                # filter that rejects the line)
+                if all(accept(logevent) for accept in accepts):
                     self._outputLine(logevent, self.args['shorten'],
                                      self.args['human'])
 
                 # if at least one filter refuses to accept any
                 # remaining lines, stop
-                if any([f.skipRemaining() for f in self.filters]):
+                if skips and any(skip() for skip in skips):
                     # if input is not stdin
                     if sys.stdin.isatty():
                         break
 
+        sys.stdout.flush()
+
 
 def main():
     tool = MLogFilterTool()
@@ -7,6 +7,10 @@ import sys
 import mtools.mloginfo.sections as sections
 from mtools.util.cmdlinetool import LogFileTool
 
+# all section classes from the sections module, collected once at import
+SECTION_CLASSES = [c[1] for c in inspect.getmembers(sections,
+                                                    inspect.isclass)]
+
 
 class MLogInfoTool(LogFileTool):
 
@@ -29,10 +33,8 @@ class MLogInfoTool(LogFileTool):
         self.argparser_sectiongroup = self.argparser.add_argument_group(inf,
                                                                         cmds)
 
-        # add all filter classes from the filters module
-        self.sections = ([c[1](self)
-                          for c in inspect.getmembers(sections,
-                                                      inspect.isclass)])
+        # add all section classes from the sections module
+        self.sections = [c(self) for c in SECTION_CLASSES]
 
     def run(self, arguments=None):
         """Print useful information about the log file."""
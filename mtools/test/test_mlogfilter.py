@@ -118,6 +118,31 @@ class TestMLogFilter(object):
             assert(le.datetime >= random_start and le.datetime <= random_end)
         assert at_least_one
 
+    def test_from_to_local_timezone(self):
+        # bounds given in UTC for a -0400 log
+        self._test_base('mongod_26.log')
+        start = parser.parse('2014-04-10T03:20:00+00:00')
+        end = parser.parse('2014-04-10T03:25:00+00:00')
+
+        self.tool.run('%s --from %s --to %s' % (self.logfile_path,
+                                                start.isoformat(),
+                                                end.isoformat()))
+        output = sys.stdout.getvalue()
+
+        # bounds are converted to the tzinfo of the log lines
+        timezone = self.tool.args['logfile'][0].timezone
+        datetime_filter = self.tool.filters[0]
+        assert(datetime_filter.fromDateTime.tzinfo is timezone)
+        assert(datetime_filter.toDateTime.tzinfo is timezone)
+        assert(datetime_filter.fromDateTime == start)
+        assert(datetime_filter.toDateTime == end)
+
+        expected = [le.datetime for le in self.logfile
+                    if le.datetime and start <= le.datetime <= end]
+        assert(len(expected) > 0)
+        datetimes = [LogEvent(line).datetime for line in output.splitlines()]
+        assert([dt for dt in datetimes if dt] == expected)
+
     def test_from_to_stdin(self):
 
         year = datetime.now().year
@@ -322,6 +347,13 @@ class TestMLogFilter(object):
         assert any(line.startswith('active filters: SlowFilter')
                    for line in lines)
 
+    def test_filter_order(self):
+        self.tool.run('%s --word lock --namespace local.oplog.rs --slow '
+                      '--to end --from start +1min' % self.logfile_path)
+        names = [f.__class__.__name__ for f in self.tool.filters]
+        assert names == ['DateTimeFilter', 'SlowFilter', 'WordFilter',
+                         'LogLineFilter']
+
     def test_namespace(self):
         self.tool.run('%s --namespace local.oplog.rs' % self.logfile_path)
         output = sys.stdout.getvalue()
@@ -363,6 +395,23 @@ class TestMLogFilter(object):
         for line in output.splitlines():
             assert('lock' in line)
 
+    def test_word_multiple(self):
+        self.tool.run('%s --word assert lock' % self.logfile_path)
+        output = sys.stdout.getvalue()
+        lines = output.splitlines()
+        assert(len(lines) > 0)
+        for line in lines:
+            assert('assert' in line or 'lock' in line)
+
+    def test_word_inline_flag(self):
+        # each word is its own regex, so inline flags in any word work
+        self.tool.run('%s --word lock (?i)ASSERT' % self.logfile_path)
+        output = sys.stdout.getvalue()
+        lines = output.splitlines()
+        assert(len(lines) > 0)
+        for line in lines:
+            assert('assert' in line.lower() or 'lock' in line)
+
     def test_mask_end(self):
         mask_path = os.path.join(os.path.dirname(mtools.__file__),
                                  'test/logfiles/', 'mask_centers.log')
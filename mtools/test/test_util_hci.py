@@ -1,6 +1,6 @@
 from datetime import datetime, timedelta
 
-from dateutil.tz import tzutc
+from dateutil.tz import tzoffset, tzutc
 
 from mtools.util.hci import DateTimeBoundaries
 
@@ -126,6 +126,10 @@ def test_dtb_string2dt():
                                                  tzinfo=tzutc())
     assert dtb.string2dt('Sep 2011 +1mo') == datetime(2011, 10, 1, 0, 0,
                                                       tzinfo=tzutc())
+    assert dtb.string2dt('Sep 2011 +1y') == datetime(2012, 9, 1, 0, 0,
+                                                     tzinfo=tzutc())
+    assert dtb.string2dt('Jan 31 2012 +1mo') == datetime(2012, 2, 29, 0, 0,
+                                                         tzinfo=tzutc())
     assert dtb.string2dt('29 Sep 1978 +3hours') == datetime(1978, 9, 29, 3, 0,
                                                             tzinfo=tzutc())
     assert dtb.string2dt('20 Mar +5min') == datetime(2015, 3, 20, 0, 5,
@@ -188,5 +192,23 @@ def test_dtb_string2dt():
     assert dtb.string2dt('-5hours', lower) == lower - timedelta(hours=5)
 
 
+def test_dtb_string2dt_cached_per_timezone():
+
+    start = datetime(2012, 10, 14, tzinfo=tzutc())
+    end = datetime(2013, 6, 2, tzinfo=tzutc())
+    tz = tzoffset(None, -4 * 3600)
+
+    # same boundaries in another timezone, parsed results must not be shared
+    dtb_utc = DateTimeBoundaries(start, end)
+    dtb_local = DateTimeBoundaries(start.astimezone(tz), end.astimezone(tz))
+
+    assert dtb_utc.string2dt('Feb 18 2013') == datetime(2013, 2, 18,
+                                                        tzinfo=tzutc())
+    assert dtb_local.string2dt('Feb 18 2013') == datetime(2013, 2, 18,
+                                                          tzinfo=tz)
+    assert dtb_utc.string2dt('Feb 18 2013') == datetime(2013, 2, 18,
+                                                        tzinfo=tzutc())
+
+
 if __name__ == '__main__':
     test_dtb_string2dt()
@@ -137,6 +137,16 @@ def test_logevent_datetime_parsing():
     assert(le.datetime.tzinfo is not None)
 
 
+def test_logevent_datetime_parsing_malformed_ctime_day():
+    """Check that odd ctime day tokens are left to dateutil."""
+
+    le = LogEvent('Wed Dec 2011 19:00:00.000 [conn1] test')
+    assert(str(le.datetime) == '2011-12-07 19:00:00+00:00')
+
+    le = LogEvent('Wed Dec 99 19:00:00.000 [conn1] test')
+    assert(str(le.datetime) == '1999-12-01 19:00:00+00:00')
+
+
 def test_logevent_pattern_parsing():
     le = LogEvent(line_pattern_26_a)
     assert(le.pattern) == '{"a": 1}'
@@ -306,3 +316,20 @@ def test_logevent_lazy_evaluation():
     le.parse_all()
     for attr in fields:
         assert(getattr(le, attr) is not None)
+
+
+def test_logevent_line_str_changes():
+    """ Check that line_str reflects changes to its parts. """
+
+    le = LogEvent(line_ctime)
+    assert(le.line_str == line_ctime)
+
+    le.merge_marker_str = '{a}'
+    assert(le.line_str == '{a} ' + line_ctime)
+
+    le._reformat_timestamp('iso8601-utc', force=True)
+    assert(le.line_str.startswith('{a} ' + le.datetime.strftime('%Y-')))
+    assert(le.line_str.endswith('[initandlisten] db version v2.4.5'))
+
+    le.set_line_str(line_ctime_pre24)
+    assert(le.line_str == line_ctime_pre24)
@@ -1,3 +1,4 @@
+import io
 import os
 from datetime import datetime
 import re
@@ -9,6 +10,13 @@ from mtools.util.logevent import LogEvent
 from mtools.util.logfile import LogFile
 
 
+class BytesLogStream(io.BytesIO):
+    """Binary log stream without a file descriptor, so it can't be mmap'ed."""
+
+    name = 'bytes.log'
+    mode = 'rb'
+
+
 class TestUtilLogFile(object):
 
     def setup(self):
@@ -212,3 +220,36 @@ class TestUtilLogFile(object):
         assert ('step 6 of 6', '213') in chunk_moved_to[4]
         assert chunk_moved_to[5] == "success"
 
+    def test_read_lines(self, tmp_path):
+        """
+        LogFile: test _read_lines() yields the same lines as iterating
+        over the file, both memory-mapped and read block by block.
+        """
+
+        # long line, multi-byte characters crossing small block boundaries,
+        # empty line, and no newline at the end
+        content = ('Wed Dec 31 19:00:00.000 [conn1] caf\u00e9 \u20ac\U0001f600\n'
+                   '\n'
+                   'Wed Dec 31 19:00:01.000 [conn2] ' + 'x' * 100 + '\n'
+                   '\u00e9\u00e9\u00e9\u00e9\u00e9\u00e9\u00e9\n'
+                   'Wed Dec 31 19:00:02.000 [conn3] end \u20ac')
+        content = content.encode('utf-8')
+        expected = [line.decode('utf-8') for line in io.BytesIO(content)]
+
+        logfile_path = tmp_path / 'read_lines.log'
+        logfile_path.write_bytes(content)
+        empty_path = tmp_path / 'empty.log'
+        empty_path.write_bytes(b'')
+
+        for filehandle, empty in ((open(str(logfile_path), 'rb'),
+                                   open(str(empty_path), 'rb')),
+                                  (BytesLogStream(content),
+                                   BytesLogStream(b''))):
+            logfile = LogFile(filehandle)
+            for block_size in (7, 64):
+                filehandle.seek(0)
+                lines = list(logfile._read_lines(block_size=block_size))
+                assert lines == expected
+
+            logfile.filehandle = empty
+            assert list(logfile._read_lines(block_size=7)) == []
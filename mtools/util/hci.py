@@ -3,8 +3,10 @@
 
 import re
 from datetime import datetime, timedelta
+from functools import lru_cache
 
 from dateutil import parser
+from dateutil.relativedelta import relativedelta
 from dateutil.tz import tzutc
 from dateutil.utils import default_tzinfo
 
@@ -17,7 +19,16 @@ class DateTimeBoundaries(object):
     timeunits = ['secs', 'sec', 's', 'mins', 'min', 'm', 'months', 'month',
                  'mo', 'hours', 'hour', 'h', 'days', 'day', 'd', 'weeks',
                  'week', 'w', 'years', 'year', 'y']
+    # keyword for timedelta (or relativedelta) for each of the above
+    timeunitKeywords = {'secs': 'seconds', 'sec': 'seconds', 's': 'seconds',
+                        'mins': 'minutes', 'min': 'minutes', 'm': 'minutes',
+                        'months': 'months', 'month': 'months', 'mo': 'months',
+                        'hours': 'hours', 'hour': 'hours', 'h': 'hours',
+                        'days': 'days', 'day': 'days', 'd': 'days',
+                        'weeks': 'weeks', 'week': 'weeks', 'w': 'weeks',
+                        'years': 'years', 'year': 'years', 'y': 'years'}
     weekdays = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
+    weekdayNumbers = dict(zip(weekdays, range(7)))
 
     dtRegexes = OrderedDict([
         # special constants
@@ -35,6 +46,17 @@ class DateTimeBoundaries(object):
                               '|'.join(timeunits) + ')' + '($|\s+)'))
     ])
 
+    # all of the above as named alternatives, matched in a single pass
+    dtRegex = re.compile('|'.join('(?P<%s>%s)' % (idx, regex.pattern)
+                                  for idx, regex in dtRegexes.items()))
+
+    # string consisting only of a time (with optional timezone postfix)
+    timeOnlyRegex = re.compile(r'(?P<hour>\d{1,2}):(?P<minute>\d{2,2})'
+                               r'(?::(?P<second>\d{2,2})'
+                               r'(?:.(?P<microsecond>\d{3,3}))?)?'
+                               r'(?P<timezone>[0-9Z:\+\-]+)?$')
+    yearRegex = re.compile(r'\d{4,4}')
+
     def __init__(self, start, end):
         """Initialize DateTimeBoundaries with true start/end datetime objs."""
         if start > end:
@@ -52,33 +74,62 @@ class DateTimeBoundaries(object):
 
     def string2dt(self, s, lower_bound=None):
         """Return datetime from a given string."""
+        # results only depend on the arguments and the boundaries, except
+        # for constants relative to the current time
+        if any(c in s for c in ('now', 'today', 'yesterday')):
+            return self._string2dt(s, lower_bound, self.start, self.end)
+
+        # equal datetimes in different timezones compare equal, but the
+        # result takes its timezone from them: make the timezones part of
+        # the key (by repr, dateutil's tzinfo objects are not hashable)
+        tzinfos = (repr(self.start.tzinfo), repr(self.end.tzinfo),
+                   repr(lower_bound.tzinfo) if lower_bound else None)
+        return self._cached_string2dt(s, lower_bound, self.start, self.end,
+                                      tzinfos)
+
+    @classmethod
+    @lru_cache(maxsize=128)
+    def _cached_string2dt(cls, s, lower_bound, start, end, tzinfos):
+        """Memoized version of _string2dt, tzinfos is only for the key."""
+        return cls._string2dt(s, lower_bound, start, end)
+
+    @classmethod
+    def _string2dt(cls, s, lower_bound, start, end):
+        """Return datetime from a given string and boundaries."""
         original_s = s
 
-        result = {}
         dt = None
 
         # if s is completely empty, return start or end,
         # depending on what parameter is evaluated
         if s == '':
-            return self.end if lower_bound else self.start
-
-        # first try to match the defined regexes
-        for idx in self.dtRegexes:
-            regex = self.dtRegexes[idx]
-            mo = regex.search(s)
-            # if match was found, cut it out of original string and
-            # store in result
-            if mo:
-                result[idx] = mo
-                s = s[:mo.start(0)] + s[mo.end(0):]
+            return end if lower_bound else start
+
+        # first try to match the defined regexes, keeping the first match
+        # of each kind
+        constant_mo = weekday_mo = offset_mo = None
+        for mo in cls.dtRegex.finditer(s):
+            kind = mo.lastgroup
+            if kind == 'constant':
+                constant_mo = constant_mo or mo
+            elif kind == 'weekday':
+                weekday_mo = weekday_mo or mo
+            else:
+                offset_mo = offset_mo or mo
+
+        # cut matches out of original string, last one first so that the
+        # positions of the others stay valid
+        matches = [mo for mo in (constant_mo, weekday_mo, offset_mo) if mo]
+        for mo in sorted(matches, key=lambda mo: mo.start(), reverse=True):
+            s = s[:mo.start(0)] + s[mo.end(0):]
 
         # handle constants
-        if 'constant' in result:
-            constant = result['constant'].group(0).strip()
+        if constant_mo:
+            constant = constant_mo.group(0).strip()
             if constant == 'end':
-                dt = self.end
+                dt = end
             elif constant == 'start':
-                dt = self.start
+                dt = start
             elif constant == 'today':
                 dt = datetime.now().replace(hour=0, minute=0, second=0,
                                             microsecond=0)
@@ -88,13 +139,13 @@ class DateTimeBoundaries(object):
             elif constant == 'now':
                 dt = datetime.now()
 
-        elif 'weekday' in result:
-                weekday = result['weekday'].group(0).strip()
+        elif weekday_mo:
+                weekday = weekday_mo.group(0).strip()
                 # assume most-recently occured weekday in logfile
-                most_recent_date = self.end.replace(hour=0, minute=0, second=0,
-                                                    microsecond=0)
+                most_recent_date = end.replace(hour=0, minute=0, second=0,
+                                               microsecond=0)
                 offset = (most_recent_date.weekday() -
-                          self.weekdays.index(weekday)) % 7
+                          cls.weekdayNumbers[weekday]) % 7
                 dt = most_recent_date - timedelta(days=offset)
 
         # if anything remains unmatched, try parsing it with dateutil's parser
@@ -105,13 +156,10 @@ class DateTimeBoundaries(object):
                 else:
                     # check if it's only time, then use the start dt as
                     # default, else just use the current year
-                    if re.match('(?P<hour>\d{1,2}):(?P<minute>\d{2,2})'
-                                '(?::(?P<second>\d{2,2})'
-                                '(?:.(?P<microsecond>\d{3,3}))?)?'
-                                '(?P<timezone>[0-9Z:\+\-]+)?$', s):
-                        default = self.end if lower_bound else self.start
+                    if cls.timeOnlyRegex.match(s):
+                        default = end if lower_bound else start
                     else:
-                        default = datetime(self.end.year, 1, 1, 0, 0, 0)
+                        default = datetime(end.year, 1, 1, 0, 0, 0)
                     default = default.replace(second=0, microsecond=0)
 
                     dt = parser.parse(s, default=default)
@@ -121,11 +169,11 @@ class DateTimeBoundaries(object):
                                  "can't parse datetime from %s" % s)
 
         if not dt:
-            dt = lower_bound or self.end
+            dt = lower_bound or end
 
         # if no timezone specified, use the one from the logfile
         if dt.tzinfo is None:
-            dt = dt.replace(tzinfo=self.start.tzinfo)
+            dt = dt.replace(tzinfo=start.tzinfo)
 
         # time is applied separately (not through the parser) so that string
         # containing only time don't use today as default date
@@ -137,48 +185,32 @@ class DateTimeBoundaries(object):
         #     dt = dt.replace(**dct)
 
         # apply offset
-        if 'offset' in result:
+        if offset_mo:
 
             # separate in operator, value, unit
-            dct = result['offset'].groupdict()
-
-            mult = 1
-            if dct['unit'] in ['s', 'sec', 'secs']:
-                dct['unit'] = 'seconds'
-            elif dct['unit'] in ['m', 'min', 'mins']:
-                dct['unit'] = 'minutes'
-            elif dct['unit'] in ['h', 'hour', 'hours']:
-                dct['unit'] = 'hours'
-            elif dct['unit'] in ['d', 'day', 'days']:
-                dct['unit'] = 'days'
-            elif dct['unit'] in ['w', 'week', 'weeks']:
-                dct['unit'] = 'days'
-                mult = 7
-            elif dct['unit'] in ['mo', 'month', 'months']:
-                dct['unit'] = 'days'
-                mult = 30.43
-            elif dct['unit'] in ['y', 'year', 'years']:
-                dct['unit'] = 'days'
-                mult = 365.24
-
-            if dct['operator'] == '-':
-                mult *= -1
-
-            dt = dt + eval('timedelta(%s=%i)' % (dct['unit'],
-                                                 mult * int(dct['value'])))
+            unit = cls.timeunitKeywords[offset_mo.group('unit')]
+            value = int(offset_mo.group('value'))
+            if offset_mo.group('operator') == '-':
+                value = -value
+
+            if unit in ['months', 'years']:
+                # calendar arithmetic, timedelta has no months or years
+                dt = dt + relativedelta(**{unit: value})
+            else:
+                dt = dt + timedelta(**{unit: value})
 
         # if parsed datetime is out of bounds and no year specified,
         # try to adjust year
-        year_present = re.search('\d{4,4}', original_s)
+        year_present = cls.yearRegex.search(original_s)
 
-        if not year_present and 'constant' not in result:
-            if (dt < self.start and
-                    dt.replace(year=dt.year + 1) >= self.start and
-                    dt.replace(year=dt.year + 1) <= self.end):
+        if not year_present and not constant_mo:
+            if (dt < start and
+                    dt.replace(year=dt.year + 1) >= start and
+                    dt.replace(year=dt.year + 1) <= end):
                 dt = dt.replace(year=dt.year + 1)
-            elif (dt > self.end and
-                    dt.replace(year=dt.year - 1) >= self.start and
-                    dt.replace(year=dt.year - 1) <= self.end):
+            elif (dt > end and
+                    dt.replace(year=dt.year - 1) >= start and
+                    dt.replace(year=dt.year - 1) <= end):
                 dt = dt.replace(year=dt.year - 1)
 
         return dt
@@ -42,6 +42,33 @@ class LogEvent(object):
     request.
     """
 
+    # one LogEvent is created per log line: keep the known attributes in
+    # slots, the per-instance dict is only created when needed
+    __slots__ = ('_actualPlanSummary', '_actual_query', '_actual_sort',
+                 '_allowDiskUse', '_autocommit', '_bytesRead',
+                 '_bytesWritten', '_client_metadata',
+                 '_client_metadata_calculated', '_command',
+                 '_command_calculated', '_component', '_conn',
+                 '_counters_calculated', '_cursorid', '_datetime',
+                 '_datetime_calculated', '_datetime_format',
+                 '_datetime_nextpos', '_datetime_str', '_debug', '_duration',
+                 '_duration_calculated', '_hostname', '_level',
+                 '_level_calculated', '_line_str', '_line_str_joined',
+                 '_line_str_parts', '_locks', '_lsid', '_namespace',
+                 '_ndeleted', '_ninserted', '_nreturned', '_nscanned',
+                 '_nscannedObjects', '_ntoreturn', '_numYields', '_nupdated',
+                 '_operation', '_operation_calculated', '_pattern',
+                 '_planSummary', '_profile_doc', '_r', '_r_acquiring',
+                 '_readConcern', '_readTimestamp', '_reapedtime',
+                 '_sort_pattern', '_split_tokens', '_split_tokens_calculated',
+                 '_terminationCause', '_thread', '_thread_calculated',
+                 '_timeActiveMicros', '_timeInactiveMicros',
+                 '_timeReadingMicros', '_timeWritingMicros', '_txnNumber',
+                 '_w', '_w_acquiring', '_writeConflicts', '_year_rollover',
+                 'from_string', 'merge_marker_str',
+                 # other tools attach their own attributes
+                 '__dict__')
+
     # datetime handler for json encoding
     dthandler = lambda obj: obj.isoformat() if isinstance(obj,
                                                           datetime) else None
@@ -50,6 +77,20 @@ class LogEvent(object):
     months = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep',
               'Oct', 'Nov', 'Dec']
 
+    # constant-time lookups for the per-line datetime checks
+    weekday_names = frozenset(weekdays)
+    month_numbers = dict(zip(months, range(1, 13)))
+
+    # ctime time token: 19:00:00 (ctime-pre2.4) or 19:00:00.000 (ctime)
+    ctime_time_regex = re.compile(r'(\d{2}):(\d{2}):(\d{2})(?:\.(\d{3}))?$')
+
+    # sanity check for iso8601 timestamps before handing them to dateutil
+    iso8601_regex = re.compile(r'\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}.\d{3}')
+
+    # durations not logged as a trailing "<n>ms" token
+    flushing_regex = re.compile(r'flushing mmaps took (\d+)ms')
+    checkpoint_regex = re.compile(r'Checkpoint took (\d+) seconds to complete')
+
     log_operations = ['query', 'insert', 'update', 'remove', 'getmore',
                       'command', 'aggregate', 'transaction']
     log_levels = ['D', 'F', 'E', 'W', 'I', 'U']
@@ -149,6 +190,8 @@ class LogEvent(object):
         self._level = None
         self._component = None
         self.merge_marker_str = ''
+        self._line_str_parts = None
+        self._line_str_joined = None
 
         self._client_metadata_calculated = False
         self._client_metadata = None
@@ -169,13 +212,14 @@ class LogEvent(object):
 
     def get_line_str(self):
         """Return line_str depending on source, logfile or system.profile."""
-        if self.from_string:
-            return ' '.join([s for s in [self.merge_marker_str,
-                                         self._datetime_str,
-                                         self._line_str] if s])
-        else:
-            return ' '.join([s for s in [self._datetime_str,
-                                         self._line_str] if s])
+        # filters and output may ask for line_str several times per line,
+        # only join again when one of the parts has changed
+        parts = (self.merge_marker_str if self.from_string else '',
+                 self._datetime_str, self._line_str)
+        if parts != self._line_str_parts:
+            self._line_str_parts = parts
+            self._line_str_joined = ' '.join([s for s in parts if s])
+        return self._line_str_joined
 
     line_str = property(get_line_str, set_line_str)
 
@@ -207,18 +251,17 @@ class LogEvent(object):
                     space_pos = line_str.rfind(" ")
                     if space_pos == -1:
                         return
-                    self._duration = int(line_str[line_str.rfind(" ") +
-                                                  1:-2].replace(',', ''))
+                    self._duration = int(line_str[space_pos + 1:-2]
+                                         .replace(',', ''))
                 except ValueError:
                     self._duration = None
-            elif "flushing" in self.line_str:
-                matchobj = re.search(r'flushing mmaps took (\d+)ms',
-                                     self.line_str)
+            elif "flushing" in line_str:
+                matchobj = self.flushing_regex.search(line_str)
                 if matchobj:
                     self._duration = int(matchobj.group(1))
             # SERVER-16176 - Logging of slow checkpoints
-            elif "Checkpoint took" in self.line_str:
-                matchobj = re.search("Checkpoint took ([\d]+) seconds to complete", self.line_str)
+            elif "Checkpoint took" in line_str:
+                matchobj = self.checkpoint_regex.search(line_str)
                 if matchobj:
                     self._duration = int(matchobj.group(1)) * 1000
 
@@ -299,7 +342,7 @@ class LogEvent(object):
         if format.startswith('ctime'):
             if (len(self.split_tokens) < 4 or
                     self.split_tokens[self._datetime_nextpos - 4] not in
-                    self.weekdays):
+                    self.weekday_names):
                 _ = self.datetime
                 return False
             return True
@@ -328,21 +371,27 @@ class LogEvent(object):
         iso8601-utc     1970-01-01T00:00:00.000Z
         iso8601-local   1969-12-31T19:00:00.000+0500
         """
+        # fast path: all formats start with either a weekday or a digit,
+        # reject anything else before doing any further work
+        if not (tokens[0][:1].isdigit() or
+                tokens[0] in self.weekday_names):
+            return None
+
         # first check: less than 4 tokens can't be ctime
         assume_iso8601_format = len(tokens) < 4
 
         # check for ctime-pre-2.4 or ctime format
         if not assume_iso8601_format:
             weekday, month, day, time = tokens[:4]
-            if (len(tokens) < 4 or (weekday not in self.weekdays) or
-                    (month not in self.months) or not day.isdigit()):
+            month_number = self.month_numbers.get(month)
+            if (weekday not in self.weekday_names or month_number is None or
+                    not day.isdigit()):
                 assume_iso8601_format = True
 
         if assume_iso8601_format:
             # sanity check, because the dateutil parser could interpret
             # any numbers as a valid date
-            if not re.match(r'\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}.\d{3}',
-                            tokens[0]):
+            if not self.iso8601_regex.match(tokens[0]):
                 return None
 
             # convinced that this is a ISO-8601 format, the dateutil parser
@@ -355,8 +404,21 @@ class LogEvent(object):
             # assume current year unless self.year_rollover
             # is set (from LogFile)
             year = datetime.now().year
-            dt = dateutil.parser.parse(' '.join(tokens[: 4]),
-                                       default=datetime(year, 1, 1))
+            dt = None
+            mo = len(day) <= 2 and self.ctime_time_regex.match(time)
+            if mo:
+                # fast path: build the datetime directly from the tokens,
+                # leaving out-of-range values to the dateutil fallback
+                hour, minute, second, millis = mo.groups()
+                try:
+                    dt = datetime(year, month_number, int(day),
+                                  int(hour), int(minute), int(second),
+                                  int(millis or 0) * 1000)
+                except ValueError:
+                    pass
+            if dt is None:
+                dt = dateutil.parser.parse(' '.join(tokens[: 4]),
+                                           default=datetime(year, 1, 1))
 
             if dt.tzinfo is None:
                 dt = dt.replace(tzinfo=tzutc())
@@ -824,22 +886,24 @@ class LogEvent(object):
                                     self._readConcern = (
                                     split_tokens[t + 1 + self.datetime_nextpos + 2].replace(',', ''))
                             elif (counter == 'readTimestamp' and token.startswith('readTimestamp')):
-                                vars(self)['_' + counter] = (token.split(':')
-                                [-1]).replace(',', '')
+                                setattr(self, '_' + counter,
+                                        token.split(':')[-1].replace(',', ''))
                             elif (counter == 'terminationCause' and token.startswith('terminationCause')):
-                                vars(self)['_' + counter] = (token.split(':')
-                                [-1]).replace(',', '')
+                                setattr(self, '_' + counter,
+                                        token.split(':')[-1].replace(',', ''))
                             else:
-                                vars(self)['_' + counter] = int((token.split(':')
-                                                             [-1]).replace(',',
-                                                                           ''))
+                                setattr(self, '_' + counter,
+                                        int(token.split(':')[-1]
+                                            .replace(',', '')))
 
                             # extract allowDiskUse counter
                             if (counter == 'allowDiskUse' and token.startswith('allowDiskUse')):
                                 # Splitting space between token and value
                                 self._allowDiskUse = split_tokens[t + 1 + self.datetime_nextpos + 2].replace(',','')
                             else:
-                                vars(self)['_' + counter] = int((token.split(':')[-1]).replace(',', ''))
+                                setattr(self, '_' + counter,
+                                        int(token.split(':')[-1]
+                                            .replace(',', '')))
 
                         except ValueError:
                             # see if this is a pre-2.5.2 numYields with space
@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 
+import mmap
 import os
 import re
 import sys
@@ -335,6 +336,77 @@ class LogFile(InputSource):
         """Return the number of lines in a log file."""
         return self.num_lines
 
+    def _read_lines(self, block_size=1 << 20):
+        """
+        Yield all remaining lines of the file as strings.
+
+        Binary files are decoded and split in large blocks, which is much
+        faster than iterating line by line. Only use this for full scans:
+        the file position does not correspond to the line being yielded.
+        """
+        if 'b' not in getattr(self.filehandle, 'mode', ''):
+            # text stream (e.g. stdin), already decoded
+            for line in self.filehandle:
+                yield line
+            return
+
+        for block in self._read_blocks(block_size):
+            lines = block.split('\n')
+            # empty string if the block ends with a newline
+            last = lines.pop()
+            for line in lines:
+                yield line + '\n'
+            if last:
+                yield last
+
+    def _read_blocks(self, block_size):
+        """
+        Yield the rest of a binary file as decoded blocks of complete lines.
+
+        Regular files are memory-mapped and decoded straight from the
+        mapping, other streams are read block by block.
+
+        Note that a mapped file must not shrink while it is scanned: if a
+        live log is truncated underneath (e.g. logrotate's copytruncate),
+        the process is killed with SIGBUS rather than seeing EOF.
+        """
+        try:
+            data = mmap.mmap(self.filehandle.fileno(), 0,
+                             access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            # not a regular file (pipe, in-memory stream) or empty file
+            data = None
+
+        if data is None:
+            remainder = b''
+            while True:
+                block = self.filehandle.read(block_size)
+                if not block:
+                    break
+
+                # only decode complete lines, keep the rest for the next block
+                block = remainder + block
+                end = block.rfind(b'\n') + 1
+                remainder = block[end:]
+                if end:
+                    yield block[:end].decode('utf-8', 'replace')
+
+            if remainder:
+                yield remainder.decode('utf-8', 'replace')
+            return
+
+        with data, memoryview(data) as view:
+            pos = self.filehandle.tell()
+            size = len(data)
+            while pos < size:
+                # cut the block after the last newline within block_size
+                end = data.rfind(b'\n', pos, pos + block_size) + 1
+                if not end:
+                    # very long line, extend the block to its end
+                    end = data.find(b'\n', pos + block_size) + 1 or size
+                yield str(view[pos:end], 'utf-8', 'replace')
+                pos = end
+
     def _iterate_lines(self):
         """Count number of lines (can be expensive)."""
         self._num_lines = 0
@@ -342,10 +414,7 @@ class LogFile(InputSource):
         self._rs_state = []
         
         ln = 0
-        for ln, line in enumerate(self.filehandle):
-            if isinstance(line, bytes):
-                line = line.decode("utf-8", "replace")
-
+        for ln, line in enumerate(self._read_lines()):
             if (self._has_level is None and
                     line[28:31].strip() in LogEvent.log_levels and
                     line[31:39].strip() in LogEvent.log_components):
@@ -599,11 +668,12 @@ class LogFile(InputSource):
         
         prev_line = ""
 
-        for line in self.filehandle:
-            if isinstance(line, bytes):
-                line = line.decode("utf-8", "replace")
+        # determine the binary up front, it requires a separate pass over
+        # the file which must not happen while reading it below
+        binary = self.binary
 
-            if self.binary == "mongos":
+        for line in self._read_lines():
+            if binary == "mongos":
         
                 if "Starting new replica set monitor for" in line:
                     if "[mongosMain]" in line:
@@ -621,7 +691,7 @@ class LogFile(InputSource):
                                         match.group('replSetMembers'))
                             self._shards.append(shard_info)
 
-            elif self.binary == "mongod":
+            elif binary == "mongod":
                 logevent = LogEvent(line)
                 if "New replica set config in use" in line:
                     